@@ -12,8 +12,18 @@
 #       Loads and parses a strategy configuration from a JSON file, extracting parameters for strategy logic, risk management, and capital allocation.
 #   - get_credentials():
 #       Loads API credentials from a local 'credentials.json' file.
-#   - get_polygon_data(config):
+#   - fetch_ticker_aggs(client, ticker, config, cache_dir=None, multiplier=15, timespan="minute"):
+#       Fetches the aggregated bars of a single ticker into a DataFrame.
+#       When cache_dir is set, bars are read from / saved to a per-ticker pickle keyed by ticker, bar size and date range.
+#       Ranges ending today or later are always fetched live and never cached.
+#   - get_polygon_data(config, max_workers=8, cache_dir='cache'):
 #       Fetches historical aggregated bar data for specified tickers from Polygon.io using the provided configuration.
+#       Tickers are requested concurrently on a thread pool. Delete the cache directory (or pass cache_dir=None) to re-fetch.
+#   - compile_rule(rule):
+#       Translates a buy/sell rule written in pd.eval syntax into a numexpr expression, cached per rule string.
+#   - evaluate_rule(df, rule):
+#       Evaluates one rule over the whole frame with numexpr, typed from the column dtypes.
+#       Rules on text, categorical or datetime columns (e.g. ticker == 'AAA') fall back to pd.eval.
 #   - evaluate_signals(df, logic):
 #       Evaluates buy and sell signals for each ticker based on the strategy logic provided in the configuration.
 #   - Main script execution:
@@ -22,120 +32,344 @@
 #   Dependencies:
 #   - polygon (Polygon.io API client)
 #   - pandas
-#   - ta (Technical Analysis library)
+#   - numpy
+#   - numba (optional, JIT-compiles the trade simulation loop and indicator kernels)
+#   - bottleneck (moving window means and standard deviations)
+#   - numexpr (compiles and evaluates the buy/sell rules)
 #   - json
+#   - os, pickle, re, tempfile
+#   - concurrent.futures
 #   - datetime
+#   - dateutil (ships with pandas, local timezone for bar timestamps)
 #   - pdfgen (custom PDF report generator)
+#   - fpdf2 (required by pdfgen, which uses FPDF.will_page_break; the older PyFPDF 1.7 package is not supported)
 
 # Imports
 from polygon import RESTClient
 import pandas as pd
+import numpy as np
+import ast
+import io
 import json
-from datetime import datetime
-import ta  # for technical indicators
+import os
+import pickle
+import re
+import tempfile
+import tokenize
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
+from dateutil.tz import tzlocal
+import bottleneck as bn  # for moving window indicators
+import numexpr as ne  # for buy/sell rules
 from pdfgen import generate_pdf_report
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional, kernels then run as plain Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 # --- Trade Simulation with Risk Management ---
-def simulate_trades_with_risk(df, initial_cash=1000000, config={}):
+EXIT_REASONS = np.array(['Strategy logic', 'Stop loss raised', 'Stop gain raised'], dtype=object)
+
+@njit(cache=True)
+def _simulate_kernel(ts, tcode, sig, px, n_tickers, initial_cash, stop_loss_pct, take_profit_pct):
     """
-    Simulates trading with stop loss and take profit.
-    - Expects signals and prices in df.
-    - Allocates all available cash to a new position.
-    - Known limitations is a lack of a rebalancing methodology.
-    - Exits on signal, stop loss, or take profit.
+    Compiled trade loop over rows sorted by timestamp and ticker.
+    - Open positions are kept in flat arrays indexed by ticker code.
+    - Returns parallel arrays with one entry per closed trade, holding only
+      the raw trade fields; returns, PnL and shares are derived afterwards.
     """
-    stop_loss_pct = config['risk']['stop_loss']
-    take_profit_pct = config['risk']['take_profit']
+    held = np.zeros(n_tickers, dtype=np.bool_)
+    entry_price = np.zeros(n_tickers, dtype=np.float64)
+    entry_ts = np.zeros(n_tickers, dtype=np.int64)
+    pos_cash = np.zeros(n_tickers, dtype=np.float64)
 
-    df = df.sort_values(['timestamp', 'ticker'])
-    held_positions = {}
-    trades = []
+    n = len(px)
+    out_code = np.empty(n, dtype=np.int32)
+    out_entry_ts = np.empty(n, dtype=np.int64)
+    out_exit_ts = np.empty(n, dtype=np.int64)
+    out_entry_price = np.empty(n, dtype=np.float64)
+    out_exit_price = np.empty(n, dtype=np.float64)
+    out_cash = np.empty(n, dtype=np.float64)
+    out_reason = np.empty(n, dtype=np.int8)
+    n_trades = 0
     cash = initial_cash
 
-    for idx, row in df.iterrows():
-        date = row['timestamp']
-        ticker = row['ticker']
-        signal = row['signal']
-        current_price = row['close']
+    for i in range(n):
+        code = tcode[i]
+        signal = sig[i]
+        current_price = px[i]
 
         # Exit logic: check for sell signal, stop loss, or take profit
-        if ticker in held_positions:
-            position = held_positions[ticker]
-            pnl_pct = (current_price - position['entry_price']) / position['entry_price']
+        if held[code]:
+            pnl_pct = (current_price - entry_price[code]) / entry_price[code]
             stop_loss_hit = pnl_pct <= -stop_loss_pct
             take_profit_hit = pnl_pct >= take_profit_pct
 
             if signal == -1 or stop_loss_hit or take_profit_hit:
-                exit_price = current_price
-                pnl = pnl_pct * position['cash']
-                trades.append({
-                    'ticker': ticker,
-                    'entry_datetime': position['entry_datetime'],
-                    'exit_datetime': date,
-                    'entry_price': round(position['entry_price'], 4),
-                    'exit_price': round(exit_price, 4),
-                    'return_pct': round(pnl_pct * 100, 4),
-                    'pnl': round(pnl, 2),
-                    'allocated_cash': round(position['cash'], 2),
-                    'shares': round(position['shares'], 4),
-                    'holding_ticks': (date - position['entry_datetime']).total_seconds() / (15 * 60),
-                    'exit_reason': (
-                        'Strategy logic' if signal == -1 else 
-                        'Stop loss raised' if stop_loss_hit else 
-                        'Stop gain raised'
-                    )
-                })
-                cash += position['cash'] + pnl
-                del held_positions[ticker]
+                pnl = pnl_pct * pos_cash[code]
+                out_code[n_trades] = code
+                out_entry_ts[n_trades] = entry_ts[code]
+                out_exit_ts[n_trades] = ts[i]
+                out_entry_price[n_trades] = entry_price[code]
+                out_exit_price[n_trades] = current_price
+                out_cash[n_trades] = pos_cash[code]
+                out_reason[n_trades] = 0 if signal == -1 else 1 if stop_loss_hit else 2
+                n_trades += 1
+                cash += pos_cash[code] + pnl
+                held[code] = False
 
         # Buy logic: only if not already holding and cash available
-        if signal == 1 and ticker not in held_positions and cash > 0:
+        if signal == 1 and not held[code] and cash > 0:
             cash_per_position = cash  # All-in allocation
-            position_size = cash_per_position / current_price
-            held_positions[ticker] = {
-                'entry_price': current_price,
-                'entry_datetime': date,
-                'cash': cash_per_position,
-                'shares': position_size,
-            }
+            held[code] = True
+            entry_price[code] = current_price
+            entry_ts[code] = ts[i]
+            pos_cash[code] = cash_per_position
             cash -= cash_per_position
 
-    return pd.DataFrame(trades).sort_values(by='entry_datetime')
+    return (out_code[:n_trades], out_entry_ts[:n_trades], out_exit_ts[:n_trades],
+            out_entry_price[:n_trades], out_exit_price[:n_trades], out_cash[:n_trades],
+            out_reason[:n_trades])
+
+def _simulate_vectorized(ts, tcode, sig, px, n_tickers, initial_cash, stop_loss_pct, take_profit_pct):
+    """
+    NumPy trade loop used when numba is not installed.
+    - All-in allocation keeps at most one position open, so the loop steps
+      from trade to trade instead of from row to row.
+    - Exits are found by scanning the held ticker's later rows with argmax.
+    - Returns the same arrays as _simulate_kernel.
+    """
+    order = np.argsort(tcode, kind='stable')  # rows grouped by ticker, time order kept
+    bounds = np.searchsorted(tcode[order], np.arange(n_tickers + 1))
+    position = np.empty(len(order), dtype=np.int64)
+    position[order] = np.arange(len(order))
+    buy_rows = np.flatnonzero(sig == 1)
+
+    trades = []
+    cash = initial_cash
+    cursor = 0
+    while cash > 0:
+        k = np.searchsorted(buy_rows, cursor)
+        if k == len(buy_rows):
+            break
+        i = buy_rows[k]
+        code = tcode[i]
+        entry_price = px[i]
+
+        # Scan the ticker's later rows in growing windows until an exit shows up
+        start, stop, width, exit_row = position[i] + 1, bounds[code + 1], 64, -1
+        while start < stop:
+            rows = order[start:min(start + width, stop)]
+            ret = (px[rows] - entry_price) / entry_price
+            hit = (sig[rows] == -1) | (ret <= -stop_loss_pct) | (ret >= take_profit_pct)
+            if hit.any():
+                exit_row = rows[np.argmax(hit)]
+                break
+            start += width
+            width *= 2
+        if exit_row < 0:
+            break  # position is still open at the end of the data
+
+        pnl_pct = (px[exit_row] - entry_price) / entry_price
+        reason = 0 if sig[exit_row] == -1 else 1 if pnl_pct <= -stop_loss_pct else 2
+        trades.append((code, ts[i], ts[exit_row], entry_price, px[exit_row], cash, reason))
+        cash += pnl_pct * cash
+        cursor = exit_row  # the exit row may open the next position
+
+    dtypes = (np.int32, np.int64, np.int64, np.float64, np.float64, np.float64, np.int8)
+    columns = zip(*trades) if trades else [()] * len(dtypes)
+    return tuple(np.array(col, dtype=dtype) for col, dtype in zip(columns, dtypes))
+
+def _is_ticker_time_sorted(tcode, ts):
+    """Checks in O(n) that rows are ordered by ticker code, then strictly by time within each ticker."""
+    same_ticker = tcode[1:] == tcode[:-1]
+    return bool(np.all(tcode[1:] >= tcode[:-1]) and np.all(ts[1:][same_ticker] > ts[:-1][same_ticker]))
+
+def simulate_trades_with_risk(df, initial_cash=1000000, config={}):
+    """
+    Simulates trading with stop loss and take profit.
+    - Expects signals and prices in df.
+    - Allocates all available cash to a new position.
+    - Known limitations is a lack of a rebalancing methodology.
+    - Exits on signal, stop loss, or take profit.
+    """
+    stop_loss_pct = config['risk']['stop_loss']
+    take_profit_pct = config['risk']['take_profit']
+
+    tickers = pd.Categorical(df['ticker'])
+    tcode = tickers.codes.astype(np.int32)
+    ts = df['timestamp'].to_numpy(dtype='datetime64[ns]').view(np.int64)
+    # Rows are simulated in timestamp, ticker order
+    if _is_ticker_time_sorted(tcode, ts):
+        # Ticker blocks are already in time order, a stable sort on time just merges them
+        order = np.argsort(ts, kind='stable')
+    else:
+        order = np.lexsort((tcode, ts))
+    simulate = _simulate_kernel if NUMBA_AVAILABLE else _simulate_vectorized
+    code, entry_ts, exit_ts, entry_price, exit_price, allocated_cash, reason = simulate(
+        ts[order],
+        tcode[order],
+        df['signal'].to_numpy(dtype=np.int8)[order],
+        df['close'].to_numpy(dtype=np.float64)[order],
+        len(tickers.categories),
+        float(initial_cash),
+        float(stop_loss_pct),
+        float(take_profit_pct),
+    )
+
+    # Trades come out in exit order, which is nearly entry order already
+    by_entry = np.argsort(entry_ts, kind='stable')
+    code, entry_ts, exit_ts, entry_price, exit_price, allocated_cash, reason = (
+        arr[by_entry] for arr in (code, entry_ts, exit_ts, entry_price, exit_price, allocated_cash, reason))
+
+    # Derived trade fields are computed once for all trades
+    pnl_pct = (exit_price - entry_price) / entry_price
+    trades = pd.DataFrame({
+        'ticker': tickers.categories.to_numpy(dtype=object)[code],
+        'entry_datetime': pd.to_datetime(entry_ts, unit='ns'),
+        'exit_datetime': pd.to_datetime(exit_ts, unit='ns'),
+        'entry_price': np.round(entry_price, 4),
+        'exit_price': np.round(exit_price, 4),
+        'return_pct': np.round(pnl_pct * 100, 4),
+        'pnl': np.round(pnl_pct * allocated_cash, 2),
+        'allocated_cash': np.round(allocated_cash, 2),
+        'shares': np.round(allocated_cash / entry_price, 4),
+        'holding_ticks': (exit_ts - entry_ts) / (15 * 60 * 1e9),
+        'exit_reason': EXIT_REASONS[reason],
+    })
+    return trades
 
 # --- Indicator Computation ---
+@njit(cache=True)
+def _ewm_mean(values, alpha, min_periods):
+    """
+    Exponentially weighted mean matching pandas ewm(alpha=..., adjust=False).
+    - Leading NaNs are skipped, later NaNs keep decaying the previous mean.
+    """
+    n = len(values)
+    out = np.full(n, np.nan)
+    if n == 0:
+        return out
+    weighted = values[0]
+    nobs = 0 if np.isnan(weighted) else 1
+    if nobs >= min_periods:
+        out[0] = weighted
+    old_wt = 1.0
+    for i in range(1, n):
+        cur = values[i]
+        is_obs = not np.isnan(cur)
+        nobs += is_obs
+        if not np.isnan(weighted):
+            old_wt *= 1.0 - alpha
+            if is_obs:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif is_obs:
+            weighted = cur
+        if nobs >= min_periods:
+            out[i] = weighted
+    return out
+
+@njit(cache=True)
+def _wilder_rsi(close, window):
+    """
+    RSI with Wilder smoothing of gains and losses, computed in one pass.
+    - Matches ta.momentum.RSIIndicator(close, window).rsi().
+    """
+    n = len(close)
+    out = np.full(n, np.nan)
+    if n == 0:
+        return out
+    alpha = 1.0 / window
+    avg_up = 0.0
+    avg_down = 0.0
+    for i in range(n):
+        if i > 0:
+            diff = close[i] - close[i - 1]
+            up = diff if diff > 0 else 0.0
+            down = -diff if diff < 0 else 0.0
+            old_wt = 1.0 - alpha
+            if avg_up != up:
+                avg_up = (old_wt * avg_up + alpha * up) / (old_wt + alpha)
+            if avg_down != down:
+                avg_down = (old_wt * avg_down + alpha * down) / (old_wt + alpha)
+        if i + 1 >= window:
+            out[i] = 100.0 if avg_down == 0 else 100.0 - 100.0 / (1.0 + avg_up / avg_down)
+    return out
+
+def _ewm_mean_pandas(values, alpha, min_periods):
+    """pandas version of _ewm_mean, used when numba is not installed."""
+    return pd.Series(values).ewm(alpha=alpha, min_periods=min_periods, adjust=False).mean().to_numpy()
+
+def _wilder_rsi_pandas(close, window):
+    """pandas version of _wilder_rsi, used when numba is not installed."""
+    diff = pd.Series(close).diff()
+    avg_up = _ewm_mean_pandas(diff.where(diff > 0, 0.0), 1.0 / window, window)
+    avg_down = _ewm_mean_pandas(-diff.where(diff < 0, 0.0), 1.0 / window, window)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(avg_down == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_up / avg_down))
+
+def _moving(move_func, values, window):
+    """Applies a bottleneck moving window function, NaN until the window is full."""
+    if len(values) < window:
+        return np.full(len(values), np.nan)
+    return move_func(values, window, min_count=window)
+
 def compute_indicators(df, config):
     short_window = config['params'].get('short_window', 20)
     long_window = config['params'].get('long_window', 50)
+    ewm_mean = _ewm_mean if NUMBA_AVAILABLE else _ewm_mean_pandas
+    wilder_rsi = _wilder_rsi if NUMBA_AVAILABLE else _wilder_rsi_pandas
 
-    def compute_group_indicators(group):
-        group = group.sort_index()
+    def compute_block_indicators(close):
         # Moving Averages
-        group['short_ma'] = group['close'].rolling(short_window).mean()
-        group['long_ma'] = group['close'].rolling(long_window).mean()
+        short_ma = _moving(bn.move_mean, close, short_window)
+        long_ma = _moving(bn.move_mean, close, long_window)
         # RSI
-        group['rsi'] = ta.momentum.RSIIndicator(close=group['close'], window=14).rsi()
+        rsi = wilder_rsi(close, 14)
         # MACD
-        macd = ta.trend.MACD(close=group['close'])
-        group['macd'] = macd.macd()
-        group['macd_signal'] = macd.macd_signal()
+        macd = ewm_mean(close, 2 / (12 + 1), 12) - ewm_mean(close, 2 / (26 + 1), 26)
+        macd_signal = ewm_mean(macd, 2 / (9 + 1), 9)
         # Bollinger Bands
-        bb = ta.volatility.BollingerBands(close=group['close'], window=20, window_dev=2)
-        group['bb_upper'] = bb.bollinger_hband()
-        group['bb_lower'] = bb.bollinger_lband()
-        group['bb_middle'] = bb.bollinger_mavg()
-        # Round
-        cols_to_round = ['short_ma', 'long_ma', 'rsi', 'macd', 'macd_signal', 'bb_upper', 'bb_lower', 'bb_middle']
-        group[cols_to_round] = group[cols_to_round].round(4)
-        return group
-
-    # Apply per ticker
-    df = df.groupby('ticker', group_keys=False).apply(compute_group_indicators, include_groups=True)
-    df = df.dropna(subset=['short_ma', 'long_ma'])  # Drop rows with insufficient data
+        bb_middle = _moving(bn.move_mean, close, 20)
+        bb_std = _moving(bn.move_std, close, 20)
+        return {
+            'short_ma': short_ma,
+            'long_ma': long_ma,
+            'rsi': rsi,
+            'macd': macd,
+            'macd_signal': macd_signal,
+            'bb_upper': bb_middle + 2 * bb_std,
+            'bb_lower': bb_middle - 2 * bb_std,
+            'bb_middle': bb_middle,
+        }
+
+    # Sort once so every ticker is a contiguous block, then fill whole columns per block
+    df = df.sort_values(['ticker', 'timestamp'])
+    close = df['close'].to_numpy(dtype=np.float64)
+    _, starts = np.unique(pd.Categorical(df['ticker']).codes, return_index=True)
+    bounds = np.append(starts, len(df))
+    columns = {}
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        for name, values in compute_block_indicators(close[start:end]).items():
+            columns.setdefault(name, np.empty(len(df)))[start:end] = values
+    df = df.assign(**columns)
+    df = df.dropna(subset=['short_ma', 'long_ma']).reset_index(drop=True)  # Drop rows with insufficient data
     return df
 
 # --- Strategy Config Loader ---
 def load_strategy_config(json_path: str):
-    config = json.load(open(json_path))
+    with open(json_path) as f:
+        config = json.load(f)
     # Extract fields from config
     name = config['strategy_name']
     tickers = config['tickers']
@@ -145,6 +379,9 @@ def load_strategy_config(json_path: str):
     end_date = datetime.strptime(config['parameters']['end_date'], "%Y-%m-%d")
     buy_condition = config['logic']['buy_condition']
     sell_condition = config['logic']['sell_condition']
+    # Parse the rules up front so syntax errors surface at load time
+    compile_rule(buy_condition)
+    compile_rule(sell_condition)
     capital = config.get('capital', 100000)
     rebalance = config.get('rebalance', 'daily')
     sizing_method = config['position_sizing'].get('method', 'equal_weight')
@@ -175,37 +412,133 @@ def load_strategy_config(json_path: str):
 
 # --- Credentials Loader ---
 def get_credentials():
-    return json.load(open('credentials.json'))['api_key']
+    with open('credentials.json') as f:
+        return json.load(f)['api_key']
 
 # --- Polygon Data Fetcher ---
-def get_polygon_data(config):
+def fetch_ticker_aggs(client, ticker, config, cache_dir=None, multiplier=15, timespan="minute"):
+    start_date = config['params']['start_date']
+    end_date = config['params']['end_date']
+    cache_path = None
+    # Only closed ranges are cached, a range reaching today can still gain bars
+    if cache_dir is not None and end_date.date() < date.today():
+        safe_ticker = re.sub(r'[^A-Za-z0-9._-]', '_', ticker)  # e.g. X:BTCUSD is not a valid Windows file name
+        cache_path = os.path.join(
+            cache_dir, f"{safe_ticker}_{multiplier}{timespan}_{start_date:%Y%m%d}_{end_date:%Y%m%d}.pkl")
+        if os.path.exists(cache_path):
+            try:
+                return pd.read_pickle(cache_path)
+            except (EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError, ValueError):
+                pass  # truncated or written by an incompatible pandas, fetch again and overwrite
+
+    aggs = list(client.list_aggs(ticker=ticker, multiplier=multiplier, timespan=timespan,
+                                 from_=start_date, to=end_date, limit=50000))
+    df_ticker = pd.DataFrame(aggs)
+    df_ticker['ticker'] = ticker
+    if cache_path is not None and len(df_ticker):
+        # Write to a temporary file and move it into place, so readers never see a partial pickle
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        os.close(fd)
+        try:
+            df_ticker.to_pickle(tmp_path)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    return df_ticker
+
+def get_polygon_data(config, max_workers=8, cache_dir='cache'):
     client = RESTClient(api_key=get_credentials())
     tickers = config['tickers']
-    df_aggs = pd.DataFrame()
-    for ticker in tickers:
-        aggs = []
-        for a in client.list_aggs(ticker=ticker, multiplier=15, timespan="minute",
-                                 from_=config['params']['start_date'], to=config['params']['end_date'], limit=50000):
-            aggs.append(a)
-            _aggs = pd.DataFrame(aggs)
-            _aggs['ticker'] = ticker
-        df_aggs = pd.concat([df_aggs, _aggs])
-    df_aggs['timestamp'] = df_aggs['timestamp'].apply(lambda x: datetime.fromtimestamp(x/1000))
-    df_aggs.sort_index(inplace=True)
+    # Requests are network-bound, so tickers are fetched concurrently
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tickers)))) as pool:
+        per_ticker = list(pool.map(lambda ticker: fetch_ticker_aggs(client, ticker, config, cache_dir), tickers))
+    df_aggs = pd.concat(per_ticker, ignore_index=True)
+    df_aggs['ticker'] = pd.Categorical(df_aggs['ticker'])
+    # Epoch milliseconds to naive local wall time, as datetime.fromtimestamp did
+    df_aggs['timestamp'] = (pd.to_datetime(df_aggs['timestamp'], unit='ms', utc=True)
+                            .dt.tz_convert(tzlocal()).dt.tz_localize(None))
     return df_aggs
 
 # --- Signal Evaluation ---
+class _BitwiseRule(ast.NodeTransformer):
+    """Rewrites and/or/not and chained comparisons into the bitwise form numexpr expects."""
+
+    @staticmethod
+    def _chain(op, values):
+        result = values[0]
+        for value in values[1:]:
+            result = ast.BinOp(left=result, op=op, right=value)
+        return result
+
+    def visit_BoolOp(self, node):
+        self.generic_visit(node)
+        return self._chain(ast.BitAnd() if isinstance(node.op, ast.And) else ast.BitOr(), node.values)
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Not):
+            return ast.UnaryOp(op=ast.Invert(), operand=node.operand)
+        return node
+
+    def visit_Compare(self, node):
+        self.generic_visit(node)
+        operands = [node.left] + node.comparators
+        pairs = [ast.Compare(left=left, ops=[op], comparators=[right])
+                 for left, op, right in zip(operands, node.ops, operands[1:])]
+        return self._chain(ast.BitAnd(), pairs)
+
+@lru_cache(maxsize=None)
+def compile_rule(rule):
+    """
+    Translates a buy/sell rule written for pd.eval into numexpr syntax.
+    - '&', '|' and '~' bind like and/or/not, as in pd.eval.
+    - Returns the numexpr expression and the column names it reads, in argument order.
+    """
+    swaps = {'&': 'and', '|': 'or', '~': 'not'}
+    tokens = [(tokenize.NAME, swaps[tok.string]) if tok.type == tokenize.OP and tok.string in swaps
+              else (tok.type, tok.string)
+              for tok in tokenize.generate_tokens(io.StringIO(rule.strip()).readline)]
+    tree = ast.parse(tokenize.untokenize(tokens).strip(), mode='eval')
+    functions = {node.func.id for node in ast.walk(tree)
+                 if isinstance(node, ast.Call) and isinstance(node.func, ast.Name)}
+    names = sorted({node.id for node in ast.walk(tree) if isinstance(node, ast.Name)} - functions)
+    expr = ast.unparse(ast.fix_missing_locations(_BitwiseRule().visit(tree)))
+    return expr, tuple(names)
+
+# numexpr argument types per NumPy dtype kind; other kinds (text, categories, datetimes) use pd.eval
+RULE_DTYPES = {'b': bool, 'i': np.int64, 'u': np.int64, 'f': np.float64}
+
+@lru_cache(maxsize=None)
+def _rule_program(expr, signature):
+    """Builds the numexpr program for one column dtype signature, or None if numexpr cannot run it."""
+    try:
+        return ne.NumExpr(expr, signature=list(signature))
+    except (NotImplementedError, TypeError, ValueError, KeyError):
+        return None
+
+def evaluate_rule(df, rule):
+    expr, names = compile_rule(rule)
+    columns = [df[name].to_numpy() for name in names]
+    kinds = [column.dtype.kind for column in columns]
+    if all(kind in RULE_DTYPES for kind in kinds):
+        signature = tuple((name, RULE_DTYPES[kind]) for name, kind in zip(names, kinds))
+        program = _rule_program(expr, signature)
+        if program is not None:
+            return program(*(column.astype(dtype, copy=False)
+                             for column, (_, dtype) in zip(columns, signature))).astype(bool)
+    # Rules numexpr cannot run, e.g. ticker == 'AAA', are evaluated by pandas as before
+    return np.asarray(pd.eval(rule, local_dict={name: df[name] for name in names}, engine='python'), dtype=bool)
+
 def evaluate_signals(df, logic):
-    def compute_signals(group):
-        group = group.copy()
-        group['buy'] = pd.eval(logic['buy'], local_dict=group, engine='python')
-        group['sell'] = pd.eval(logic['sell'], local_dict=group, engine='python')
-        group['signal'] = 0
-        group.loc[group['buy'], 'signal'] = 1
-        group.loc[group['sell'], 'signal'] = -1
-        return group
-
-    df = df.groupby('ticker', group_keys=False).apply(compute_signals, include_groups=True)
+    # Rules only combine columns of the same row, so the whole frame is evaluated at once
+    df = df.copy()
+    masks = {side: evaluate_rule(df, logic[side]) for side in ('buy', 'sell')}
+    df['buy'] = masks['buy']
+    df['sell'] = masks['sell']
+    # 1 = buy, -1 = sell, 0 = hold; a row matching both rules is a sell
+    df['signal'] = np.where(masks['sell'], np.int8(-1), np.where(masks['buy'], np.int8(1), np.int8(0)))
     return df
 
 # --- Main Script ---